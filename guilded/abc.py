@@ -98,6 +98,11 @@ class Messageable(metaclass=abc.ABCMeta):
         * :class:`.Member`
         * :class:`.ext.commands.Context`
     """
+
+    # Attribute storage is provided by implementing classes; this must stay
+    # empty because implementers combine this class with other slotted bases.
+    __slots__ = ()
+
     def __init__(self, *, state, data):
         self._state = state
         self.id: str = data.get('id')
@@ -237,14 +242,13 @@ class Messageable(metaclass=abc.ABCMeta):
             include_private=include_private,
         )
 
-        messages = []
-        for message in history.get('messages', []):
-            try:
-                messages.append(self._state.create_message(channel=self._channel, data=message))
-            except:
-                pass
-
-        return messages
+        # _channel is a property that can be surprisingly expensive to
+        # resolve repeatedly, so it is passed in once for the whole page.
+        return ChatMessage._bulk_from_history(
+            self._state,
+            self._channel,
+            history.get('messages') or (),
+        )
 
     async def fetch_message(self, message_id: str, /) -> ChatMessage:
         """|coro|
@@ -339,6 +343,7 @@ class User(Hashable, metaclass=abc.ABCMeta):
     """
 
     __slots__ = (
+        '_state',
         'type',
         '_user_type',
         'id',
@@ -347,7 +352,7 @@ class User(Hashable, metaclass=abc.ABCMeta):
         'name',
         'nick',
         'colour',
-        'subdomain',
+        'slug',
         'games',
         'bio',
         'tagline',
@@ -356,9 +361,13 @@ class User(Hashable, metaclass=abc.ABCMeta):
         'blocked_at',
         'online_at',
         'created_at',
-        'default_avatar',
-        'avatar',
-        'banner',
+        '_default_avatar',
+        '_avatar',
+        '_avatar_url',
+        '_banner',
+        '_banner_url',
+        '_mention',
+        '_profile_url',
         'moderation_status',
         'badges',
         'stonks',
@@ -367,52 +376,51 @@ class User(Hashable, metaclass=abc.ABCMeta):
     def __init__(self, *, state, data: UserPayload, **extra):
         self._state = state
         data = data.get('user', data)
+        # This constructor runs for every user in bulk payloads (member
+        # lists, message floods), so avoid repeated lookups of the same keys.
+        get = data.get
 
         self.type = None
-        self._user_type = try_enum(UserType, data.get('type', 'user'))
-        self.id: str = data.get('id')
-        self.bot_id: str = data.get('botId')
+        self._user_type = try_enum(UserType, get('type', 'user'))
+        self.id: str = get('id')
+        self.bot_id: str = get('botId')
         self.dm_channel = None
-        self.name: str = data.get('name') or ''
+        self.name: str = get('name') or ''
         self.nick: Optional[str] = None
         self.colour: Colour = Colour(0)
-        self.slug: Optional[str] = data.get('subdomain')
-        self.games: List = data.get('aliases', [])
-        self.bio: str = (data.get('aboutInfo') or {}).get('bio') or ''
-        self.tagline: str = (data.get('aboutInfo') or {}).get('tagLine') or ''
-        self.presence: Presence = Presence.from_value(data.get('userPresenceStatus')) or None
-        status = data.get('userStatus') or {}
+        self.slug: Optional[str] = get('subdomain')
+        self.games: List = get('aliases', [])
+        about_info = get('aboutInfo') or {}
+        self.bio: str = about_info.get('bio') or ''
+        self.tagline: str = about_info.get('tagLine') or ''
+        self.presence: Presence = Presence.from_value(get('userPresenceStatus')) or None
+        status = get('userStatus') or {}
         if status.get('content'):
             self.status: Optional[Activity] = Activity.build(status['content'])
         else:
             self.status: Optional[Activity] = None
 
-        self.blocked_at: Optional[datetime.datetime] = ISO8601(data.get('blockedDate'))
-        self.online_at: Optional[datetime.datetime] = ISO8601(data.get('lastOnline'))
-        self.created_at: datetime.datetime = ISO8601(data.get('createdAt') or data.get('joinDate'))
+        self.blocked_at: Optional[datetime.datetime] = ISO8601(get('blockedDate'))
+        self.online_at: Optional[datetime.datetime] = ISO8601(get('lastOnline'))
+        self.created_at: datetime.datetime = ISO8601(get('createdAt') or get('joinDate'))
         # in profilev3, createdAt is returned instead of joinDate
 
-        self.default_avatar: Asset = Asset._from_default_user_avatar(self._state, 1)
+        # Assets are constructed lazily in their properties so that users
+        # hydrated in bulk (e.g. from member lists) don't pay for assets
+        # that are never accessed.
+        self._default_avatar: Optional[Asset] = None
+        self._avatar: Optional[Asset] = None
+        self._avatar_url: Optional[str] = get('avatar') or get('profilePicture') or get('profilePictureLg') or get('profilePictureSm') or get('profilePictureBlur')
+        self._banner: Optional[Asset] = None
+        self._banner_url: Optional[str] = get('banner') or get('profileBannerLg') or get('profileBannerSm') or get('profileBannerBlur')
 
-        avatar = None
-        _avatar_url = data.get('avatar') or data.get('profilePicture') or data.get('profilePictureLg') or data.get('profilePictureSm') or data.get('profilePictureBlur')
-        if _avatar_url:
-            if 'WebhookThumbnail' in _avatar_url:
-                # Custom webhook avatars. Default webhook avatars use UserAvatar.
-                avatar = Asset._from_webhook_thumbnail(self._state, _avatar_url)
-            else:
-                avatar = Asset._from_user_avatar(self._state, _avatar_url)
-        self.avatar: Optional[Asset] = avatar
-
-        banner = None
-        _banner_url = data.get('banner') or data.get('profileBannerLg') or data.get('profileBannerSm') or data.get('profileBannerBlur')
-        if _banner_url:
-            banner = Asset._from_user_banner(self._state, _banner_url)
-        self.banner: Optional[Asset] = banner
+        self.moderation_status: Optional[str] = get('moderationStatus')
+        self.badges: List = get('badges') or []
+        self.stonks: Optional[int] = get('stonks')
 
-        self.moderation_status: Optional[str] = data.get('moderationStatus')
-        self.badges: List = data.get('badges') or []
-        self.stonks: Optional[int] = data.get('stonks')
+        # Memoized strings derived only from the immutable user ID.
+        self._mention: Optional[str] = None
+        self._profile_url: Optional[str] = None
 
     def __str__(self) -> str:
         return self.display_name or ''
@@ -420,9 +428,43 @@ class User(Hashable, metaclass=abc.ABCMeta):
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} id={self.id!r} name={self.name!r} type={self._user_type!r}>'
 
+    @property
+    def default_avatar(self) -> Asset:
+        if self._default_avatar is None:
+            self._default_avatar = Asset._from_default_user_avatar(self._state, 1)
+        return self._default_avatar
+
+    @property
+    def avatar(self) -> Optional[Asset]:
+        if self._avatar is None and self._avatar_url:
+            if 'WebhookThumbnail' in self._avatar_url:
+                # Custom webhook avatars. Default webhook avatars use UserAvatar.
+                self._avatar = Asset._from_webhook_thumbnail(self._state, self._avatar_url)
+            else:
+                self._avatar = Asset._from_user_avatar(self._state, self._avatar_url)
+        return self._avatar
+
+    @avatar.setter
+    def avatar(self, value: Optional[Asset]) -> None:
+        self._avatar = value
+        self._avatar_url = None
+
+    @property
+    def banner(self) -> Optional[Asset]:
+        if self._banner is None and self._banner_url:
+            self._banner = Asset._from_user_banner(self._state, self._banner_url)
+        return self._banner
+
+    @banner.setter
+    def banner(self, value: Optional[Asset]) -> None:
+        self._banner = value
+        self._banner_url = None
+
     @property
     def profile_url(self) -> str:
-        return f'https://guilded.gg/profile/{self.id}'
+        if self._profile_url is None:
+            self._profile_url = f'https://guilded.gg/profile/{self.id}'
+        return self._profile_url
 
     @property
     def vanity_url(self) -> Optional[str]:
@@ -436,7 +478,9 @@ class User(Hashable, metaclass=abc.ABCMeta):
 
         This will render and deliver a mention when sent in an :class:`.Embed`.
         """
-        return f'<@{self.id}>'
+        if self._mention is None:
+            self._mention = f'<@{self.id}>'
+        return self._mention
 
     @property
     def display_name(self) -> str:
@@ -481,6 +525,26 @@ class ServerChannel(Hashable, metaclass=abc.ABCMeta):
         * :class:`.VoiceChannel`
     """
 
+    __slots__ = (
+        '_state',
+        '_group',
+        '_channel_id',
+        'group_id',
+        'server_id',
+        'parent_id',
+        'category_id',
+        'id',
+        'type',
+        'name',
+        'topic',
+        'public',
+        'created_by_id',
+        'created_at',
+        'updated_at',
+        'archived_by_id',
+        'archived_at',
+    )
+
     def __init__(self, *, state, data: ServerChannelPayload, group: Group, **extra):
         self._state = state
         self._group = group
@@ -1335,6 +1335,7 @@ class ForumTopic(Hashable, HasContentMixin):
         '_state',
         'channel',
         'channel_id',
+        'server_id',
         'id',
         'title',
         'content',
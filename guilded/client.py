@@ -56,8 +56,9 @@ import asyncio
 import logging
 import sys
 import traceback
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generator, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generator, List, Optional, Type, Union, ValuesView
 
+from .backoff import ExponentialBackoff
 from .errors import ClientException, HTTPException
 from .enums import *
 from .events import BaseEvent
@@ -109,6 +110,11 @@ class Client:
     max_messages: Optional[:class:`int`]
         The maximum number of messages to store in the internal message cache.
         This defaults to ``1000``. Passing in ``None`` disables the message cache.
+    cache_members_on_startup: Optional[:class:`bool`]
+        Whether to fill the internal server's member cache before connecting.
+        This defaults to ``True``. Passing in ``False`` skips the hydration,
+        which can significantly speed up startup for large servers at the
+        cost of member cache lookups missing until members are seen.
 
     Attributes
     -----------
@@ -136,12 +142,19 @@ class Client:
         self.loop: asyncio.AbstractEventLoop = _loop
         self.max_messages: int = 1000 if max_messages is MISSING else max_messages
         self._listeners = {}
+        # Handlers registered through the `event` decorator, keyed by interned
+        # method name so that `dispatch` can skip `getattr` on the hot path.
+        self._event_handlers = {}
+        # event name -> interned 'on_'-prefixed method name, so that dispatch
+        # does not build a new string for every gateway event.
+        self._event_method_names = {}
 
         # state
         self._closed: bool = False
         self._ready: asyncio.Event = MISSING
 
         self.internal_server_id = internal_server_id
+        self.cache_members_on_startup: bool = options.pop('cache_members_on_startup', True)
         self.ws: Optional[GuildedWebSocket] = None
         self.http: HTTPClient = HTTPClient(
             max_messages=self.max_messages,
@@ -171,35 +184,49 @@ class Client:
         return self.http.my_id
 
     @property
-    def cached_messages(self) -> List[ChatMessage]:
-        """List[:class:`.ChatMessage`]: The list of cached messages that the client has seen recently."""
-        return list(self.http._messages.values())
+    def cached_messages(self) -> ValuesView[ChatMessage]:
+        """The cached messages that the client has seen recently.
+
+        This is a live view of the message cache rather than a copy; wrap it
+        in ``list(...)`` if you need to index it or mutate the cache while
+        iterating.
+        """
+        return self.http._messages.values()
 
     @property
-    def emotes(self) -> List[Emote]:
-        """List[:class:`.Emote`]: The list of emotes that the client can see."""
-        return list(self.http._emotes.values())
+    def emotes(self) -> ValuesView[Emote]:
+        """The emotes that the client can see."""
+        return self.http._emotes.values()
 
     @property
-    def servers(self) -> List[Server]:
-        """List[:class:`.Server`]: The list of servers that the client can see."""
-        return list(self.http._servers.values())
+    def servers(self) -> ValuesView[Server]:
+        """The servers that the client can see.
+
+        This is a live view of the server cache rather than a copy.
+        """
+        return self.http._servers.values()
 
     @property
-    def users(self) -> List[User]:
-        """List[:class:`~guilded.User`]: The list of users that the client can see.
+    def users(self) -> ValuesView[User]:
+        """The users that the client can see.
         A user is not the same as a member, which is a server-specific representation.
-        To get all members, use :meth:`.get_all_members`\."""
-        return list(self.http._users.values())
+        To get all members, use :meth:`.get_all_members`\.
+
+        This is a live view of the user cache rather than a copy.
+        """
+        return self.http._users.values()
 
     @property
-    def dm_channels(self) -> List[DMChannel]:
-        """List[:class:`.DMChannel`]: The private/DM channels that the client can see."""
-        return list(self.http._dm_channels.values())
+    def dm_channels(self) -> ValuesView[DMChannel]:
+        """The private/DM channels that the client can see.
+
+        This is a live view of the channel cache rather than a copy.
+        """
+        return self.http._dm_channels.values()
 
     @property
-    def private_channels(self) -> List[DMChannel]:
-        """List[:class:`DMChannel`]: |dpyattr|
+    def private_channels(self) -> ValuesView[DMChannel]:
+        """|dpyattr|
 
         This is an alias of :attr:`.dm_channels`.
 
@@ -208,8 +235,8 @@ class Client:
         return self.dm_channels
 
     @property
-    def guilds(self) -> List[Server]:
-        """List[:class:`.Server`]: |dpyattr|
+    def guilds(self) -> ValuesView[Server]:
+        """|dpyattr|
 
         This is an alias of :attr:`.servers`.
 
@@ -441,6 +468,7 @@ class Client:
             raise TypeError('Event must be a coroutine.')
 
         setattr(self, coro.__name__, coro)
+        self._event_handlers[sys.intern(coro.__name__)] = coro
         log.debug('%s has successfully been registered as an event', coro.__name__)
         return coro
 
@@ -452,7 +480,9 @@ class Client:
             event_name = event
 
         log.debug('Dispatching event %s', event_name)
-        method = 'on_' + event_name
+        method = self._event_method_names.get(event_name)
+        if method is None:
+            method = self._event_method_names[event_name] = sys.intern('on_' + event_name)
 
         listeners = self._listeners.get(event_name)
         if listeners:
@@ -483,11 +513,11 @@ class Client:
                 for idx in reversed(removed):
                     del listeners[idx]
 
-        try:
-            coro = getattr(self, method)
-        except AttributeError:
-            pass
-        else:
+        coro = self._event_handlers.get(method)
+        if coro is None:
+            # Fall back to handlers defined as subclass methods
+            coro = getattr(self, method, None)
+        if coro is not None:
             self._schedule_event(coro, method, *args, **kwargs)
 
     def get_partial_messageable(
@@ -717,7 +747,11 @@ class Client:
                 'it already set in this Client\'s HTTPClient beforehand.'
             )
 
-        self.http.session = aiohttp.ClientSession()
+        # Don't clobber an existing session on restart; aiohttp binds the
+        # session to the running loop, so this must not happen any earlier
+        # than here (e.g. in __init__).
+        if self.http.session is None or self.http.session.closed:
+            self.http.session = aiohttp.ClientSession()
 
         await self._async_setup_hook()
         await self.setup_hook()
@@ -741,7 +775,8 @@ class Client:
                     }
                 )
 
-            await server.fill_members()
+            if self.cache_members_on_startup:
+                await server.fill_members()
             self.http.add_to_server_cache(server)
 
         await self.connect(token, reconnect=reconnect)
@@ -755,6 +790,8 @@ class Client:
             )
 
         while not self.closed:
+            # asyncio.wait_for rather than asyncio.timeout() because the
+            # latter requires Python 3.11+ and we support down to 3.8.
             ws_build = GuildedWebSocket.build(self, loop=self.loop)
             gws = await asyncio.wait_for(ws_build, timeout=60)
             if type(gws) != GuildedWebSocket:
@@ -766,7 +803,7 @@ class Client:
             self.dispatch('connect')
 
             async def listen_socks(ws: GuildedWebSocket):
-                next_backoff_time = 5
+                backoff = ExponentialBackoff()
                 while True and ws is not None:
                     try:
                         op = await ws.poll_event()
@@ -785,19 +822,19 @@ class Client:
                         if exc.data and exc.data.get('op') == GuildedWebSocket.INVALID_CURSOR:
                             ws._last_message_id = None
 
+                        retry = backoff.delay()
                         if ws._last_message_id:
-                            log.warning('Websocket closed with code %s, attempting to reconnect in %s seconds with last message ID %s', code, next_backoff_time, ws._last_message_id)
+                            log.warning('Websocket closed with code %s, attempting to reconnect in %.2f seconds with last message ID %s', code, retry, ws._last_message_id)
                         else:
-                            log.warning('Websocket closed with code %s, attempting to reconnect in %s seconds', code, next_backoff_time)
+                            log.warning('Websocket closed with code %s, attempting to reconnect in %.2f seconds', code, retry)
 
-                        await asyncio.sleep(next_backoff_time)
+                        await asyncio.sleep(retry)
 
                         build = GuildedWebSocket.build(self, loop=self.loop)
                         try:
                             ws = await asyncio.wait_for(build, timeout=60)
                         except asyncio.TimeoutError:
                             log.warning('Timed out trying to reconnect.')
-                            next_backoff_time += 5
                         else:
                             if type(ws) != GuildedWebSocket:
                                 self.dispatch('error', ws)
@@ -808,7 +845,6 @@ class Client:
                                 self.http.ws = self.ws
                                 self.dispatch('connect')
                     else:
-                        next_backoff_time = 5
                         if op == GuildedWebSocket.WELCOME:
                             # Because of how the gateway works currently, most of our initial cache
                             # is filled before connecting. The exception to this is `client.user`,
@@ -830,16 +866,23 @@ class Client:
         if self._closed:
             return
 
-        await self.http.close()
+        # Mark as closed up front so that concurrent or re-entrant calls
+        # (e.g. from a reconnect handler while shutdown is in progress)
+        # return immediately instead of double-closing resources.
         self._closed = True
 
-        try:
-            await self.ws.close(code=1000)
-        except Exception:
-            # it's probably already closed, but catch all anyway
-            pass
+        if self.ws is not None:
+            try:
+                await self.ws.close(code=1000)
+            except Exception:
+                # it's probably already closed, but catch all anyway
+                pass
+            self.ws = None
 
-        self._ready.clear()
+        await self.http.close()
+
+        if self._ready is not MISSING:
+            self._ready.clear()
 
     def run(self, token: str, *, reconnect=True) -> None:
         """Connect to Guilded's gateway and start the event loop. This is a
@@ -854,6 +897,17 @@ class Client:
             Whether to reconnect on loss/interruption of gateway connection.
         """
 
+        # Imported here rather than at module level so that merely importing
+        # guilded doesn't pay for (attempting) a uvloop import.
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            # libuv's event loop is considerably faster than the stdlib
+            # selector loop for aiohttp workloads; use it when available.
+            uvloop.install()
+
         async def runner():
             async with self:
                 await self.start(
@@ -76,7 +76,9 @@ class Loop:
     def __init__(self, coro, *, seconds, hours, minutes, count, reconnect, loop=None):
         self.coro = coro
         self.reconnect = reconnect
-        self.loop = loop or asyncio.get_event_loop()
+        # Defer loop resolution to start() - loops are usually constructed at
+        # import time, before any event loop is running.
+        self.loop = loop
         self.count = count
         self._current_loop = 0
         self._task = None
@@ -241,7 +243,10 @@ class Loop:
             args = (self._injected, *args)
 
         if self.loop is None:
-            self.loop = asyncio.get_event_loop()
+            try:
+                self.loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.loop = asyncio.get_event_loop()
 
         self._task = self.loop.create_task(self._loop(*args, **kwargs))
         return self._task
@@ -56,7 +56,6 @@ import time
 import aiohttp
 import asyncio
 import concurrent.futures
-import json
 import logging
 import sys
 import threading
@@ -67,10 +66,11 @@ from .errors import GuildedException, HTTPException
 from .enums import ChannelType
 from . import events as ev
 from .channel import *
+from .message import ChatMessage
 from .reaction import RawReactionActionEvent, Reaction
 from .role import Role
 from .user import ClientUser, Member
-from .utils import ISO8601
+from .utils import ISO8601, _from_json, _to_json
 from .webhook import Webhook
 
 if TYPE_CHECKING:
@@ -89,7 +89,7 @@ class WebSocketClosure(Exception):
     def __init__(self, message: str, data: Optional[str]):
         self.data: Optional[Dict]
         try:
-            self.data = json.loads(data)
+            self.data = _from_json(data)
         except:
             self.data = None
 
@@ -165,7 +165,7 @@ class GuildedWebSocket:
             raise WebSocketClosure('Socket is in a closed or closing state.', msg.data)
 
     async def send(self, payload: dict) -> None:
-        payload = json.dumps(payload)
+        payload = _to_json(payload)
         self.client.dispatch('socket_raw_send', payload)
         await self.socket.send_str(payload)
 
@@ -192,7 +192,7 @@ class GuildedWebSocket:
         else:
             log.info('Connected to the gateway')
 
-        ws = cls(socket, client, loop=loop or asyncio.get_event_loop())
+        ws = cls(socket, client, loop=loop or asyncio.get_running_loop())
         ws._parsers = WebSocketEventParsers(client)
         await ws.ping()
 
@@ -200,7 +200,7 @@ class GuildedWebSocket:
 
     async def received_event(self, payload: str) -> int:
         self.client.dispatch('socket_raw_receive', payload)
-        data: gw.EventSkeleton = json.loads(payload)
+        data: gw.EventSkeleton = _from_json(payload)
         log.debug('WebSocket has received %s', data)
 
         op = data['op']
@@ -391,7 +391,7 @@ class WebSocketEventParsers:
             self.client.dispatch(event)
 
         else:
-            message = self._state.create_message(data=data, channel=channel, author=author)
+            message = ChatMessage._from_gateway(self._state, channel, data, author=author)
             self._state.add_to_message_cache(message)
             self.client.dispatch('message', message)
 
@@ -409,7 +409,7 @@ class WebSocketEventParsers:
             if before is None:
                 return
 
-            after = self._state.create_message(data={'serverId': data['serverId'], **data['message']}, channel=before.channel)
+            after = ChatMessage._from_gateway(self._state, before.channel, data)
             self._state.add_to_message_cache(after)
             self.client.dispatch('message_edit', before, after)
 
@@ -55,8 +55,8 @@ import sys
 import aiohttp
 import asyncio
 import datetime
-import json
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, Type, TypeVar, Union
 
 from . import __version__, channel
@@ -66,7 +66,7 @@ from .enums import try_enum, ChannelType
 from .errors import Forbidden, GuildedServerError, HTTPException, NotFound
 from .message import ChatMessage
 from .user import User, Member
-from .utils import MISSING
+from .utils import MISSING, _from_json, _to_json
 
 log = logging.getLogger(__name__)
 
@@ -166,7 +166,7 @@ def handle_message_parameters(
 
     multipart = []
     if files:
-        multipart.append({'name': 'payload_json', 'value': json.dumps(payload)})
+        multipart.append({'name': 'payload_json', 'value': _to_json(payload)})
         payload = None
         for index, file in enumerate(files):
             multipart.append(
@@ -185,7 +185,7 @@ async def json_or_text(response: aiohttp.ClientResponse) -> Union[Dict[str, Any]
     text = await response.text(encoding='utf-8')
     try:
         if response.headers['content-type'] == 'application/json':
-            return json.loads(text)
+            return _from_json(text)
     except KeyError:
         # Thanks Cloudflare
         pass
@@ -224,7 +224,7 @@ class HTTPClientBase:
 
         self._users = {}
         self._servers = {}
-        self._messages = {}
+        self._messages = OrderedDict()
 
         self._threads = {}
         self._dm_channels = {}
@@ -240,7 +240,12 @@ class HTTPClientBase:
         return self._servers.get(server_id)
 
     def _get_message(self, message_id: str) -> Optional[ChatMessage]:
-        return self._messages.get(message_id)
+        message = self._messages.get(message_id)
+        if message is not None:
+            # Keep recently accessed messages at the fresh end so eviction
+            # drops the least recently used entry.
+            self._messages.move_to_end(message_id)
+        return message
 
     def _get_dm_channel(self, dm_channel_id: str) -> Optional[DMChannel]:
         return self._dm_channels.get(dm_channel_id)
@@ -260,12 +265,18 @@ class HTTPClientBase:
     def _all_server_channels(self) -> Dict[str, ServerChannel]:
         all_channels = {}
         for server in self._servers.values():
-            all_channels = {**all_channels, **server._channels}
+            all_channels.update(server._channels)
 
         return all_channels
 
     def _get_global_server_channel(self, channel_id: str) -> Optional[ServerChannel]:
-        return self._all_server_channels.get(channel_id)
+        # Check each server's cache directly rather than merging them all
+        # into a throwaway dict just to do one lookup.
+        for server in self._servers.values():
+            channel = server._channels.get(channel_id)
+            if channel is not None:
+                return channel
+        return None
 
     def _get_server_thread(self, server_id: str, thread_id: str) -> Optional[Thread]:
         if self._get_server(server_id):
@@ -279,19 +290,24 @@ class HTTPClientBase:
     def _emotes(self) -> Dict[int, Emote]:
         emotes = {}
         for server in self._servers.values():
-            emotes = {**emotes, **server._emotes}
+            emotes.update(server._emotes)
 
         return emotes
 
     def _get_emote(self, id) -> Optional[Emote]:
-        return self._emotes.get(id)
+        for server in self._servers.values():
+            emote = server._emotes.get(id)
+            if emote is not None:
+                return emote
+        return None
 
     def add_to_message_cache(self, message: ChatMessage) -> None:
         if self._max_messages is None:
             return
         self._messages[message.id] = message
+        self._messages.move_to_end(message.id)
         while len(self._messages) > self._max_messages:
-            del self._messages[list(self._messages.keys())[0]]
+            self._messages.popitem(last=False)
 
     def add_to_server_cache(self, server):
         self._servers[server.id] = server
@@ -442,7 +458,10 @@ class HTTPClient(HTTPClientBase):
 
         if 'json' in kwargs:
             headers['Content-Type'] = 'application/json'
-            kwargs['data'] = json.dumps(kwargs.pop('json'))
+            body = kwargs.pop('json')
+            # Allow callers to pass an already-serialized body so hot paths
+            # can encode once instead of per-request.
+            kwargs['data'] = body if isinstance(body, str) else _to_json(body)
 
         kwargs['headers'] = headers
 
@@ -570,6 +589,11 @@ class HTTPClient(HTTPClientBase):
 
     def create_channel_message(self, channel_id: str, *, payload: Dict[str, Any]):
         route = Route('POST', f'/channels/{channel_id}/messages')
+        if len(payload) == 1 and 'content' in payload:
+            # Plain content-only messages are by far the most common case;
+            # serialize them here without a round trip through the generic
+            # JSON encoder in request().
+            return self.request(route, json='{"content":%s}' % _to_json(payload['content']))
         return self.request(route, json=payload)
 
     def update_channel_message(self, channel_id: str, message_id: str, *, payload: Dict[str, Any]):
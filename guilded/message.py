@@ -55,6 +55,7 @@ import asyncio
 import datetime
 import logging
 import re
+import sys
 from typing import TYPE_CHECKING, Any, Dict, Optional, List, Sequence, Tuple, Union
 
 from .colour import Colour
@@ -244,6 +245,24 @@ class Mentions:
 ATTACHMENT_REGEX = re.compile(r'!\[(?P<caption>.+)?\]\((?P<url>https:\/\/(?:s3-us-west-2\.amazonaws\.com\/www\.guilded\.gg|img\.guildedcdn\.com)\/(?:ContentMediaGenericFiles|WebhookPrimaryMedia)\/[a-zA-Z0-9]+-Full\.(?P<extension>webp|jpeg|jpg|png|gif|apng)(?:\?.+)?)\)')
 
 class HasContentMixin:
+    # `_mentions` is intentionally not assigned here; several properties
+    # use `hasattr(self, '_mentions')` to distinguish API-provided mention
+    # data from mentions parsed out of rich content.
+    __slots__ = (
+        'emotes',
+        '_raw_user_mentions',
+        '_raw_channel_mentions',
+        '_raw_role_mentions',
+        '_user_mentions',
+        '_channel_mentions',
+        '_role_mentions',
+        '_mentions_everyone',
+        '_mentions_here',
+        '_mentions',
+        'embeds',
+        'attachments',
+    )
+
     def __init__(self):
         self.emotes: list = []
         self._raw_user_mentions: list = []
@@ -573,6 +592,11 @@ class ChatMessage(Hashable, HasContentMixin):
 
     __slots__ = (
         '_state',
+        '_author',
+        '_webhook',
+        '_webhook_username',
+        '_webhook_avatar_url',
+        '_share_url',
         'channel',
         'channel_id',
         'server_id',
@@ -581,13 +605,12 @@ class ChatMessage(Hashable, HasContentMixin):
         'webhook_id',
         'author_id',
         'created_at',
-        'updated_at',
+        '_updated_at',
         'deleted_at',
         'replied_to_ids',
         'silent',
         'private',
         'content',
-        'embeds',
     )
 
     def __init__(self, *, state, channel: Messageable, data, **extra: Any):
@@ -598,44 +621,102 @@ class ChatMessage(Hashable, HasContentMixin):
         self.channel = channel
         self._author = extra.get('author')
         self._webhook = extra.get('webhook')
+        self._share_url: Optional[str] = None
+
+        # This constructor runs once per inbound message; bind the payload
+        # getter once instead of re-resolving it for every field.
+        get = data.get
 
-        self.channel_id: str = data.get('channelId')
-        self.server_id: str = data.get('serverId') or data.get('teamId')
+        # Channel/server/author IDs repeat across every message from the
+        # same place; interning them makes a cache of N messages share one
+        # string per ID instead of N copies. Message IDs are unique, so
+        # interning those would only grow the intern table.
+        channel_id = get('channelId')
+        self.channel_id: str = sys.intern(channel_id) if channel_id is not None else None
+        server_id = get('serverId') or get('teamId')
+        self.server_id: str = sys.intern(server_id) if server_id is not None else None
 
         self.id: str = data['id']
-        self.type: MessageType = try_enum(MessageType, data.get('type'))
+        self.type: MessageType = try_enum(MessageType, get('type'))
 
-        self.replied_to_ids: List[str] = data.get('replyMessageIds') or data.get('repliesToIds') or []
-        self.author_id: str = data.get('createdBy')
-        self.webhook_id: Optional[str] = data.get('createdByWebhookId') or data.get('webhookId')
+        self.replied_to_ids: List[str] = get('replyMessageIds') or get('repliesToIds') or []
+        author_id = get('createdBy')
+        self.author_id: str = sys.intern(author_id) if author_id is not None else None
+        webhook_id = get('createdByWebhookId') or get('webhookId')
+        self.webhook_id: Optional[str] = sys.intern(webhook_id) if webhook_id is not None else None
         self._webhook_username: Optional[str] = None
         self._webhook_avatar_url: Optional[str] = None
 
-        self.created_at: datetime.datetime = ISO8601(data.get('createdAt'))
-        self.updated_at: Optional[datetime.datetime] = ISO8601(data.get('updatedAt') or data.get('editedAt'))
+        self.created_at: datetime.datetime = ISO8601(get('createdAt'))
+        # Most messages are never edited; keep the raw string and parse it
+        # on first access instead of paying for ISO8601 per message.
+        self._updated_at: Optional[str] = get('updatedAt') or get('editedAt')
 
-        self.silent: bool = data.get('isSilent') or False
-        self.private: bool = data.get('isPrivate') or False
+        self.silent: bool = get('isSilent') or False
+        self.private: bool = get('isPrivate') or False
 
-        if isinstance(data.get('content'), dict):
+        content = get('content')
+        if isinstance(content, dict):
             # Webhook execution responses
-            self.content: str = self._get_full_content(data['content'])
-            profile: Optional[Dict[str, str]] = data['content'].get('document', {}).get('data', {}).get('profile')
+            self.content: str = self._get_full_content(content)
+            profile: Optional[Dict[str, str]] = content.get('document', {}).get('data', {}).get('profile')
             if profile:
                 self._webhook_username = profile.get('name')
                 self._webhook_avatar_url = profile.get('profilePicture')
 
         else:
-            self.content: str = data.get('content') or ''
-            self._mentions = self._create_mentions(data.get('mentions'))
+            self.content: str = content or ''
+            mentions = get('mentions')
+            if mentions:
+                # Only allocate a Mentions wrapper when the payload actually
+                # carries mention data; the mention properties fall back to
+                # empty results when `_mentions` is unset.
+                self._mentions = self._create_mentions(mentions)
             self.embeds: List[Embed] = [
-                Embed.from_dict(embed) for embed in (data.get('embeds') or [])
+                Embed.from_dict(embed) for embed in (get('embeds') or [])
             ]
             self._extract_attachments(self.content)
 
+    @classmethod
+    def _bulk_from_history(cls, state, channel, payloads) -> List[ChatMessage]:
+        # Batch constructor for paginated history: the state and channel are
+        # invariant across the page, so bind them once and build messages in
+        # a tight loop instead of going through the generic factory (and its
+        # kwargs repacking) per message. A malformed payload only drops that
+        # one message from the page.
+        messages = []
+        append = messages.append
+        for payload in payloads:
+            try:
+                append(cls(state=state, channel=channel, data=payload))
+            except Exception:
+                log.debug('Failed to construct message %s from history', payload.get('id'), exc_info=True)
+        return messages
+
+    @classmethod
+    def _from_gateway(cls, state, channel, data, **extra) -> ChatMessage:
+        # Specialized constructor for gateway chat message envelopes, which
+        # always nest the payload under 'message' with the server ID on the
+        # envelope. Unwrapping here skips the shape probe in __init__ and
+        # the merged-dict copy that the update path previously built.
+        message = cls(state=state, channel=channel, data=data['message'], **extra)
+        if message.server_id is None:
+            server_id = data.get('serverId')
+            if server_id is not None:
+                message.server_id = sys.intern(server_id)
+        return message
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} id={self.id!r} author={self.author!r} channel={self.channel!r}>'
 
+    @property
+    def updated_at(self) -> Optional[datetime.datetime]:
+        """Optional[:class:`datetime.datetime`]: When the message was last edited."""
+        if self._updated_at is None:
+            return None
+        # ISO8601 memoizes parses, so repeated accesses are a cache hit.
+        return ISO8601(self._updated_at)
+
     @property
     def server(self) -> Server:
         """Optional[:class:`.Server`]: The server this message was sent in."""
@@ -662,16 +743,22 @@ class ChatMessage(Hashable, HasContentMixin):
         if self._author:
             return self._author
 
+        # Resolve state and IDs once up front; this property is hit on
+        # every dispatch that formats or inspects the message author.
+        state = self._state
+        author_id = self.author_id
+
         user = None
-        if self.server:
-            user = self.server.get_member(self.author_id)
+        server = state._get_server(self.server_id)
+        if server:
+            user = server.get_member(author_id)
 
         if not user:
-            user = self._state._get_user(self.author_id)
+            user = state._get_user(author_id)
 
         if self.webhook_id or self._webhook:
             data = {
-                'id': self.author_id,
+                'id': author_id,
                 'type': 'bot',
             }
             # FIll in webhook defaults if available & then profile overrides if available
@@ -683,21 +770,23 @@ class ChatMessage(Hashable, HasContentMixin):
             if self._webhook_avatar_url:
                 data['profilePicture'] = self._webhook_avatar_url
 
-            user = self._state.create_user(data=data)
+            user = state.create_user(data=data)
 
         return user
 
     @property
     def created_by_bot(self) -> bool:
         """:class:`bool`: Whether this message's author is a bot or webhook."""
-        return self.author.bot if self.author else self.webhook_id is not None
+        # author is a resolving property; evaluate it once per access.
+        author = self.author
+        return author.bot if author else self.webhook_id is not None
 
     @property
     def share_url(self) -> str:
         """:class:`str`: The share URL of the message."""
-        if self.channel:
-            return f'{self.channel.share_url}?messageId={self.id}'
-        return None
+        if self._share_url is None and self.channel:
+            self._share_url = f'{self.channel.share_url}?messageId={self.id}'
+        return self._share_url
 
     @property
     def jump_url(self) -> str:
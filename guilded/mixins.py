@@ -68,6 +68,11 @@ class EqualityComparable:
             return other.id == self.id
         return NotImplemented
 
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, self.__class__):
+            return other.id != self.id
+        return NotImplemented
+
 
 class Hashable(EqualityComparable):
     __slots__ = ()
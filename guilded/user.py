@@ -106,31 +106,32 @@ class User(guilded.abc.User, guilded.abc.Messageable):
 
             Returns the user's name.
     """
+
+    __slots__ = ()
+
     def _update(self, data: UserPayload):
-        try:
-            self.stonks: int = data.pop('stonks')
-        except KeyError:
-            pass
-
-        try:
-            self.badges: List[str] = data.pop('badges')
-        except KeyError:
-            pass
-
-        try:
-            self.tagline: str = data.pop('tagline')
-        except KeyError:
-            pass
-
-        try:
-            self.bio: str = data.pop('bio')
-        except KeyError:
-            pass
-
-        try:
-            self.subdomain: str = data.pop('subdomain')
-        except KeyError:
-            pass
+        # Sentinel pops instead of try/except KeyError; most keys are
+        # absent on any given update, and the raise/catch costs add up
+        # when members are updated in bulk.
+        stonks = data.pop('stonks', MISSING)
+        if stonks is not MISSING:
+            self.stonks: int = stonks
+
+        badges = data.pop('badges', MISSING)
+        if badges is not MISSING:
+            self.badges: List[str] = badges
+
+        tagline = data.pop('tagline', MISSING)
+        if tagline is not MISSING:
+            self.tagline: str = tagline
+
+        bio = data.pop('bio', MISSING)
+        if bio is not MISSING:
+            self.bio: str = bio
+
+        subdomain = data.pop('subdomain', MISSING)
+        if subdomain is not MISSING:
+            self.slug: str = subdomain
 
         if 'profilePicture' in data and data['profilePicture'] is not None:
             self.avatar: Optional[Asset] = Asset._from_user_avatar(self._state, data.pop('profilePicture'))
@@ -224,8 +225,10 @@ class Member(User):
     __slots__ = (
         '_state',
         '_role_ids',
-        '_user'
+        '_user',
         '_server',
+        '_owner',
+        'server_id',
         'bot_id',
         'nick',
         'xp',
@@ -313,10 +316,9 @@ class Member(User):
         return self
 
     def _update(self, data: ServerMemberPayload):
-        try:
-            self.nick = data.pop('nickname')
-        except KeyError:
-            pass
+        nick = data.pop('nickname', MISSING)
+        if nick is not MISSING:
+            self.nick = nick
 
         super()._update(data)
 
@@ -736,6 +738,8 @@ class SocialLink:
 class ClientUser(guilded.abc.User):
     """Represents the current logged-in user."""
 
+    __slots__ = ()
+
     def __init__(self, *, state, data: UserPayload):
         super().__init__(state=state, data=data)
 
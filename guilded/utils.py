@@ -51,7 +51,9 @@ DEALINGS IN THE SOFTWARE.
 
 import asyncio
 import datetime
+import functools
 from inspect import isawaitable as _isawaitable, signature as _signature
+import json
 from operator import attrgetter
 from .mixins import Hashable
 import re
@@ -59,6 +61,28 @@ from typing import Any, AsyncIterable, Callable, Coroutine, Iterable, Optional,
 import unicodedata
 from uuid import uuid1, UUID
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+
+if HAS_ORJSON:
+
+    def _to_json(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    _from_json = orjson.loads
+
+else:
+
+    def _to_json(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+
+    _from_json = json.loads
+
 
 GUILDED_EPOCH_DATETIME = datetime.datetime(2016, 1, 1)
 GUILDED_EPOCH_ISO8601 = GUILDED_EPOCH_DATETIME.isoformat() + 'Z'
@@ -86,28 +110,42 @@ class _MissingSentinel:
 
 MISSING: Any = _MissingSentinel()
 
+# Bound once so each parse skips two attribute lookups.
+_fromisoformat = datetime.datetime.fromisoformat
 
-def ISO8601(string: str):
-    if string is None:
-        return None
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso8601(string: str) -> datetime.datetime:
+    # Timestamps repeat heavily within gateway bursts and paginated
+    # history (identical createdAt/updatedAt values), so memoizing the
+    # parse replaces most calls with a hash lookup. The resulting
+    # datetimes are immutable, making the shared instances safe.
+    if string.endswith('Z'):
+        # Guilded timestamps are UTC; fromisoformat only accepts the 'Z'
+        # suffix on Python 3.11+, and naive datetimes are expected here anyway.
+        string = string[:-1]
 
     try:
-        return datetime.datetime.strptime(string, '%Y-%m-%dT%H:%M:%S.%fZ')
-    except:
+        # fromisoformat is implemented in C and is considerably faster than
+        # strptime for the fixed shapes that Guilded sends.
+        return _fromisoformat(string)
+    except ValueError:
+        # get rid of milliseconds entirely since Guilded may sometimes
+        # send a number of digits that datetime.fromisoformat does not
+        # accept
         try:
-            return datetime.datetime.strptime(string, '%Y-%m-%dT%H:%M:%SZ')
-        except:
-            # get rid of milliseconds entirely since Guilded may sometimes
-            # send a number of digits that datetime.fromisoformat does not
-            # accept
-            string = re.sub(r'\.\d{1,6}', '', string)
-            try:
-                return datetime.datetime.fromisoformat(string)
-            except:
-                pass
+            return _fromisoformat(re.sub(r'\.\d+', '', string))
+        except ValueError:
+            pass
         raise TypeError(f'{string} is not a valid ISO8601 datetime.')
 
 
+def ISO8601(string: Optional[str]) -> Optional[datetime.datetime]:
+    if string is None:
+        return None
+    return _parse_iso8601(string)
+
+
 def hyperlink(link: str, *, title: str = None) -> str:
     """A helper function to make links clickable when sent into chat.
 
@@ -53,7 +53,6 @@ from __future__ import annotations
 
 import logging
 import asyncio
-import json
 import re
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
@@ -66,7 +65,7 @@ from ..channel import ChatChannel, ListChannel, ListItem
 from ..errors import HTTPException, Forbidden, NotFound, GuildedServerError
 from ..message import ChatMessage
 from ..user import Member, User
-from ..utils import ISO8601
+from ..utils import ISO8601, _from_json, _to_json
 from ..asset import Asset
 from ..http import Route, handle_message_parameters
 from ..file import File
@@ -114,7 +113,7 @@ class AsyncWebhookAdapter:
 
         if payload is not None:
             headers['Content-Type'] = 'application/json'
-            to_send = json.dumps(payload)
+            to_send = _to_json(payload)
 
         response: Optional[aiohttp.ClientResponse] = None
         data: Optional[Union[Dict[str, Any], str]] = None
@@ -142,7 +141,7 @@ class AsyncWebhookAdapter:
                     )
                     data = (await response.text(encoding='utf-8')) or None
                     if data and response.headers['Content-Type'] == 'application/json':
-                        data = json.loads(data)
+                        data = _from_json(data)
 
                     if 300 > response.status >= 200:
                         return data